@@ -8,24 +8,34 @@
 #   • Minor UI text tweaks
 
 import streamlit as st
-from pathlib import Path
+
+from cba_core import LOGO_PATH, RECOMMENDATIONS_MD, compute_cba
 
 # ------------------------------------------------------
 # Page / UI config
 # ------------------------------------------------------
-st.set_page_config(
-    page_title="CBA Sizer",
-    page_icon="📊",
-    layout="centered",
-    initial_sidebar_state="expanded",
-)
+# Only the entry script configures the page (Streamlit runs it as __main__);
+# importing this module elsewhere must not call set_page_config again.
+if __name__ == "__main__":
+    st.set_page_config(
+        page_title="CBA Sizer",
+        page_icon="📊",
+        layout="centered",
+        initial_sidebar_state="expanded",
+    )
 
 # ------------------------------------------------------
-# Logo (optional) – place 'northwestern_logo.png' in repo root
+# Logo
 # ------------------------------------------------------
-logo_path = Path(__file__).parent / "northwestern_logo.png"
-if logo_path.exists():
-    st.image(str(logo_path), width=160)
+@st.cache_resource
+def _logo() -> bytes | None:
+    """Read the logo once per process; None if the file is missing."""
+    return LOGO_PATH.read_bytes() if LOGO_PATH.exists() else None
+
+
+logo_bytes = _logo()
+if logo_bytes:
+    st.image(logo_bytes, width=160)
 
 st.title("Community Benefit Agreement (CBA) Sizing Tool")
 
@@ -79,14 +89,6 @@ with calc_tab:
 
     target_irr = st.slider("Target Levered IRR (%)", 8.0, 20.0, 15.0, 0.5)
 
-    leverage = 0.70  # fixed 70 % debt
-    equity_share = 1 - leverage
-
-    equity = capex_total * equity_share
-    debt = capex_total * leverage
-
-    annual_profit = (target_irr / 100) * equity + (interest_rate_pct / 100) * debt
-
     # ── Adders ────────────────────────────────────────────────────────────────
     st.divider()
     st.subheader("Equity & Context Adders")
@@ -102,34 +104,19 @@ with calc_tab:
         help="Applies 1.5× multiplier to the CBA % for projects in densely populated areas.",
     )
 
-    base_low_pct, base_high_pct = 0.0025, 0.0075  # 0.25 % – 0.75 %
-    pct_multiplier = 1.0
-    if ej_flag:
-        pct_multiplier *= 1.15
-    if urban_flag:
-        pct_multiplier *= 1.15
-
-    cba_low_pct = base_low_pct * pct_multiplier
-    cba_high_pct = base_high_pct * pct_multiplier
-
-    annual_cba_low = annual_profit * cba_low_pct
-    annual_cba_high = annual_profit * cba_high_pct
-
-    project_life = 20  # fixed asset life
-    lifetime_cba_low = annual_cba_low * project_life
-    lifetime_cba_high = annual_cba_high * project_life
+    r = compute_cba(capex_total, target_irr, interest_rate_pct, ej_flag, urban_flag, "v3")
 
     # ── Results ───────────────────────────────────────────────────────────────
     st.divider()
     st.subheader("Results")
 
     col1, col2 = st.columns(2)
-    col1.metric("Annual Profit", f"${annual_profit/1e6:,.2f} M")
+    col1.metric("Annual Profit", r.profit_str)
     col2.metric("Debt : Equity", f"70 % : 30 %")
 
     col3, col4 = st.columns(2)
-    col3.metric("CBA Range (Annual)", f"${annual_cba_low/1e6:,.2f} – ${annual_cba_high/1e6:,.2f} M")
-    col4.metric("CBA Range (Lifetime 20 yrs)", f"${lifetime_cba_low/1e6:,.2f} – ${lifetime_cba_high/1e6:,.2f} M")
+    col3.metric("CBA Range (Annual)", r.annual_range_str)
+    col4.metric("CBA Range (Lifetime 20 yrs)", r.lifetime_range_str)
 
     st.info("The CBA values above represent **total contributions over the 20‑year asset life**.")
 
@@ -139,19 +126,4 @@ with calc_tab:
 with rec_tab:
     st.header("How to Use This Tool & Key Definitions")
 
-    st.markdown(
-        """
-        **Usage Steps**
-        1. Choose *Estimate CAPEX* if you only know $ / kW, or switch to *Total CAPEX* if you already have a lump‑sum budget.
-        2. Adjust financing assumptions: **Levered IRR** reflects investor expectations. For debt cost, enter the **current Federal Funds Rate**; the tool automatically adds a 2 % margin.
-        3. Toggle the **EJ** and **Urban Density** adders if the project site qualifies; each one increases the share of profit allocated to the community.
-        4. Use the *CBA Range (Lifetime)* to start negotiations with stakeholders.
-        5. You can download results via browser screenshot or copy the numbers directly.
-
-        **Adder Definitions**
-        | Adder | Multiplier | Description |
-        |-------|-----------:|-------------|
-        | Environmental‑Justice (EJ) | 1.15 × | Census tracts with disproportionate environmental or socio‑economic burdens |
-        | Urban Density | 1.15 × | Sites within densely populated areas where community impact is higher |
-        """
-    )
+    st.markdown(RECOMMENDATIONS_MD["v3"])
@@ -0,0 +1,103 @@
+# CBA Sizing Tool – shared calculation core
+# ------------------------------------------------------
+# Pure arithmetic and per‑variant constants used by the Streamlit entry
+# scripts. Nothing here builds widgets or touches page config.
+
+from pathlib import Path
+from typing import NamedTuple
+
+import streamlit as st
+
+# ------------------------------------------------------
+# Constants
+# ------------------------------------------------------
+LEVERAGE = 0.70  # fixed 70 % debt
+PROJECT_LIFE = 20  # fixed asset life (years)
+
+# Logo (optional) – place 'northwestern_logo.png' in repo root. Built here
+# because this module is imported once per process, unlike the entry
+# script, which Streamlit re-executes on every rerun.
+LOGO_PATH = Path(__file__).parent / "northwestern_logo.png"
+
+# Base CBA band as a share of annual profit, per app variant
+BASE_BANDS = {
+    "v3": (0.0025, 0.0075),  # 0.25 % – 0.75 %
+}
+
+# (EJ, Urban Density) adder multipliers, per app variant
+ADDER_MULT = {
+    "v3": (1.15, 1.15),
+}
+
+# Combined adder multiplier per variant, indexed by (ej << 1) | urban
+_MULT = {
+    variant: (1.0, urban_mult, ej_mult, ej_mult * urban_mult)
+    for variant, (ej_mult, urban_mult) in ADDER_MULT.items()
+}
+
+
+class CBAResult(NamedTuple):
+    annual_profit: float
+    annual_cba_low: float
+    annual_cba_high: float
+    lifetime_cba_low: float
+    lifetime_cba_high: float
+    # Pre‑formatted strings for the Results metrics
+    profit_str: str
+    annual_range_str: str
+    lifetime_range_str: str
+
+
+# ------------------------------------------------------
+# Core arithmetic – pure function of scalar inputs, memoised across reruns
+# ------------------------------------------------------
+@st.cache_data(show_spinner=False)
+def compute_cba(capex_total, irr_pct, rate_pct, ej, urban, variant):
+    """Return the annual/lifetime CBA figures plus their display strings."""
+    equity = capex_total * (1 - LEVERAGE)
+    debt = capex_total * LEVERAGE
+
+    annual_profit = (irr_pct / 100) * equity + (rate_pct / 100) * debt
+
+    base_low, base_high = BASE_BANDS[variant]
+    pct_multiplier = _MULT[variant][(ej << 1) | urban]
+
+    cba_low_pct = base_low * pct_multiplier
+    cba_high_pct = base_high * pct_multiplier
+
+    lo = annual_profit * cba_low_pct
+    hi = annual_profit * cba_high_pct
+    lifetime_lo = lo * PROJECT_LIFE
+    lifetime_hi = hi * PROJECT_LIFE
+
+    return CBAResult(
+        annual_profit,
+        lo,
+        hi,
+        lifetime_lo,
+        lifetime_hi,
+        profit_str=f"${annual_profit/1e6:,.2f} M",
+        annual_range_str=f"${lo/1e6:,.2f} – ${hi/1e6:,.2f} M",
+        lifetime_range_str=f"${lifetime_lo/1e6:,.2f} – ${lifetime_hi/1e6:,.2f} M",
+    )
+
+
+# ------------------------------------------------------
+# Recommendations tab copy – constant per variant, built once at import
+# ------------------------------------------------------
+RECOMMENDATIONS_MD = {
+    "v3": """
+        **Usage Steps**
+        1. Choose *Estimate CAPEX* if you only know $ / kW, or switch to *Total CAPEX* if you already have a lump‑sum budget.
+        2. Adjust financing assumptions: **Levered IRR** reflects investor expectations. For debt cost, enter the **current Federal Funds Rate**; the tool automatically adds a 2 % margin.
+        3. Toggle the **EJ** and **Urban Density** adders if the project site qualifies; each one increases the share of profit allocated to the community.
+        4. Use the *CBA Range (Lifetime)* to start negotiations with stakeholders.
+        5. You can download results via browser screenshot or copy the numbers directly.
+
+        **Adder Definitions**
+        | Adder | Multiplier | Description |
+        |-------|-----------:|-------------|
+        | Environmental‑Justice (EJ) | 1.15 × | Census tracts with disproportionate environmental or socio‑economic burdens |
+        | Urban Density | 1.15 × | Sites within densely populated areas where community impact is higher |
+        """,
+}